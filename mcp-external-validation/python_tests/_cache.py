@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Optional on-disk cache for test results.
+
+Repeated runs against the same server recompute an identical capability
+report, so each final result dict is cached under (server_url, protocol
+version, test name) with a short TTL. The cache is a pure accelerator:
+without diskcache installed every lookup is a miss and the tests run
+exactly as before. Pass --force (or "force": true in the config) to
+bypass it.
+"""
+
+import os
+from typing import Any, Optional
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+_TTL_SECONDS = 300
+
+_cache = None
+
+
+def _get_cache() -> Optional["diskcache.Cache"]:
+    """Open the cache lazily; only runs that hit it pay the open cost."""
+    global _cache
+    if _cache is None and diskcache is not None:
+        _cache = diskcache.Cache(os.path.expanduser("~/.mcp_test_cache"))
+    return _cache
+
+
+def get(server_url: str, protocol_version: str, test_name: str) -> Optional[Any]:
+    """Return the cached result for a test run, or None on a miss."""
+    cache = _get_cache()
+    if cache is None:
+        return None
+    return cache.get((server_url, protocol_version, test_name))
+
+
+def put(server_url: str, protocol_version: str, test_name: str, result: Any) -> None:
+    """Store a test result; silently a no-op without diskcache."""
+    cache = _get_cache()
+    if cache is not None:
+        cache.set(
+            (server_url, protocol_version, test_name),
+            result,
+            expire=_TTL_SECONDS,
+        )
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""Shared aiohttp session for MCP Python SDK compatibility tests.
+
+The test harness can run several tests back-to-back against the same
+server; sharing one ClientSession keeps TCP connections warm and avoids
+paying the DNS + TLS handshake cost on every test.
+"""
+
+import asyncio
+import sys
+from typing import Any, Coroutine, Optional
+
+from _types import Issue
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+_session: Optional["aiohttp.ClientSession"] = None
+
+_simd_parser = simdjson.Parser() if simdjson is not None else None
+
+# Sentinel for read_pointer callers that need to tell "field absent"
+# apart from "field is null"
+MISSING: Any = object()
+
+# Header set for requests posted as pre-encoded bytes (data=), where
+# aiohttp cannot infer the content type from json=
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Constant for the process lifetime; computed once instead of per return
+PY_VERSION = sys.version.split()[0]
+
+# Default cap on any single HTTP exchange; keeps the suite's worst case
+# bounded even when a server stalls mid-response. Tests with a configured
+# --timeout budget derive their cap via request_timeout instead.
+REQUEST_TIMEOUT = 5.0
+
+# A test makes at most about this many sequential exchanges; the overall
+# budget is split across them
+_EXCHANGES_PER_RUN = 6
+
+
+def request_timeout(config) -> float:
+    """Per-exchange cap derived from the run's overall timeout budget.
+
+    --timeout bounds a whole test run; splitting it across the exchanges
+    a test makes keeps each POST bounded without a fixed cap silently
+    overriding the configured budget (the 30 s default works out to the
+    old 5 s per exchange). Falls back to REQUEST_TIMEOUT when no budget
+    is configured.
+    """
+    budget = config.get("timeout")
+    if not budget:
+        return REQUEST_TIMEOUT
+    return budget / _EXCHANGES_PER_RUN
+
+
+def _json_serialize(obj: Any) -> str:
+    """orjson-backed serializer for json= request bodies (aiohttp wants str)."""
+    return orjson.dumps(obj).decode()
+
+
+def dumps(obj: Any) -> str:
+    """Serialize to a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    import json
+
+    return json.dumps(obj)
+
+
+def encode(obj: Any) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    import json
+
+    return json.dumps(obj).encode()
+
+
+def loads(data: Any) -> Any:
+    """Parse JSON from str or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+
+    return json.loads(data)
+
+
+_CHUNK_SIZE = 65536
+
+
+async def _read_body(response) -> bytes:
+    """Accumulate a response body via chunked reads.
+
+    Draining the stream in 64 KiB chunks lets the receive loop run while
+    earlier chunks are appended, instead of blocking in one read() for
+    the whole body. Falls back to read() when the response has no
+    content stream (or it was already consumed and cached).
+    """
+    content = getattr(response, "content", None)
+    if content is None or content.at_eof():
+        return await response.read()
+    buf = bytearray()
+    async for chunk in content.iter_chunked(_CHUNK_SIZE):
+        buf += chunk
+    return bytes(buf)
+
+
+async def read_json(response) -> Any:
+    """Decode a JSON response body, using orjson when available."""
+    return loads(await _read_body(response))
+
+
+async def read_pointer(response, pointer: str, default: Any = None) -> Any:
+    """Extract a single JSON-pointer path from a response body.
+
+    With pysimdjson available this parses the raw bytes lazily and pulls
+    only the requested field instead of materializing the full document —
+    a real saving on large tools/list or tools/call payloads. Without it,
+    falls back to a full decode plus a manual walk. aiohttp caches the
+    body, so extracting several pointers from one response is cheap.
+    """
+    raw = await response.read()
+
+    if _simd_parser is not None:
+        try:
+            value = _simd_parser.parse(raw).at_pointer(pointer)
+        except (KeyError, IndexError, TypeError, ValueError):
+            return default
+        if isinstance(value, simdjson.Object):
+            return value.as_dict()
+        if isinstance(value, simdjson.Array):
+            return value.as_list()
+        return value
+
+    value = loads(raw)
+    for key in pointer.strip("/").split("/"):
+        if isinstance(value, dict) and key in value:
+            value = value[key]
+        elif isinstance(value, list):
+            try:
+                value = value[int(key)]
+            except (IndexError, ValueError):
+                return default
+        else:
+            return default
+    return value
+
+
+def _walk_prefix(value: Any, segments: list):
+    """Yield every value under an ijson-style prefix ('item' = array element)."""
+    if not segments:
+        yield value
+        return
+    head, rest = segments[0], segments[1:]
+    if head == "item":
+        if isinstance(value, list):
+            for entry in value:
+                yield from _walk_prefix(entry, rest)
+    elif isinstance(value, dict) and head in value:
+        yield from _walk_prefix(value[head], rest)
+
+
+async def stream_array_summary(response, prefix: str) -> tuple:
+    """Return (first_item, count) for the JSON array at an ijson prefix.
+
+    The tests only ever need the first element of a listing plus its
+    length, so with ijson available the array is streamed and counted
+    without building a Python object per element — on servers exposing
+    thousands of resources that skips almost all of the decode cost.
+    Without ijson, falls back to a full decode and a generator walk.
+    """
+    raw = await response.read()
+
+    if ijson is not None:
+        items = ijson.items(raw, prefix)
+    else:
+        items = _walk_prefix(loads(raw), prefix.split("."))
+
+    first = next(items, None)
+    if first is None:
+        return None, 0
+    return first, 1 + sum(1 for _ in items)
+
+
+async def get_session() -> "aiohttp.ClientSession":
+    """Return the shared ClientSession, creating it on first use."""
+    global _session
+
+    if aiohttp is None:
+        raise RuntimeError("aiohttp is required for HTTP transport tests")
+
+    if _session is None or _session.closed:
+        kwargs = {}
+        if orjson is not None:
+            kwargs["json_serialize"] = _json_serialize
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32,
+                keepalive_timeout=30,
+                ttl_dns_cache=300,
+            ),
+            **kwargs,
+        )
+    return _session
+
+
+async def post_rpc(
+    session,
+    server_url: str,
+    request,
+    results,
+    issues,
+    *,
+    category,
+    timeout: float = REQUEST_TIMEOUT,
+):
+    """POST one JSON-RPC request and fold the standard bookkeeping.
+
+    Returns the decoded response body on success. On a non-200 status or
+    a JSON-RPC error the failure is recorded against results/issues
+    under the given category and None is returned, so call sites branch
+    on None-vs-dict instead of repeating the status/error boilerplate.
+    Accepts a pre-encoded bytes body like post_rpc_batch.
+    """
+    if isinstance(request, (bytes, bytearray)):
+        post_kwargs = {"data": request, "headers": JSON_HEADERS}
+    else:
+        post_kwargs = {"json": request}
+    try:
+        async with asyncio.timeout(timeout):
+            async with session.post(server_url, **post_kwargs) as response:
+                if response.status != 200:
+                    results.errors_encountered += 1
+                    issues.append(
+                        Issue(
+                            severity="error",
+                            category=category,
+                            description=f"Request failed with status {response.status}",
+                        )
+                    )
+                    return None
+                payload = await read_json(response)
+    except TimeoutError:
+        results.errors_encountered += 1
+        issues.append(
+            Issue(
+                severity="error",
+                category=category,
+                description=f"Request timed out after {timeout:g}s",
+            )
+        )
+        return None
+
+    results.messages_exchanged += 2
+    if isinstance(payload, dict) and "error" in payload:
+        results.errors_encountered += 1
+        issues.append(
+            Issue(
+                severity="error",
+                category=category,
+                description=f"Server returned error: {payload['error'].get('message', 'Unknown error')}",
+            )
+        )
+        return None
+    return payload
+
+
+async def post_rpc_batch(
+    session, server_url: str, requests, *, timeout: float = REQUEST_TIMEOUT
+) -> dict:
+    """POST a JSON-RPC 2.0 batch and index the responses by request id.
+
+    Pipelining independent calls into one HTTP round-trip saves
+    (N-1) * RTT versus posting them sequentially. A server that answers
+    with a single object instead of an array is treated as one response.
+    Fully constant batches can be passed pre-encoded as bytes to skip
+    serialization entirely.
+    """
+    if isinstance(requests, (bytes, bytearray)):
+        post_kwargs = {"data": requests, "headers": JSON_HEADERS}
+    else:
+        post_kwargs = {"json": requests}
+    try:
+        async with asyncio.timeout(timeout):
+            async with session.post(server_url, **post_kwargs) as response:
+                if response.status != 200:
+                    raise RuntimeError(
+                        f"Batch request failed with status {response.status}"
+                    )
+                payload = await read_json(response)
+    except TimeoutError:
+        raise RuntimeError(f"Batch request timed out after {timeout:g}s") from None
+
+    if isinstance(payload, dict):
+        payload = [payload]
+    return {entry.get("id"): entry for entry in payload if isinstance(entry, dict)}
+
+
+async def aclose() -> None:
+    """Close the shared session; safe to call if none was created."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+def run(coro: Coroutine) -> Any:
+    """asyncio.run wrapper that closes the shared session on exit.
+
+    Installs uvloop when available: the tests are dominated by many
+    small socket round-trips, exactly the pattern where libuv's loop
+    outperforms the default one. Every script entry point funnels
+    through here, so the swap happens in one place.
+    """
+    if uvloop is not None:
+        uvloop.install()
+
+    async def _runner() -> Any:
+        try:
+            return await coro
+        finally:
+            await aclose()
+
+    return asyncio.run(_runner())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Weighted-fair scheduling for test runs across several servers.
+
+With a plain gather over every (server, test) pair, one slow server can
+occupy all the concurrency slots and starve the rest. run_all keeps a
+virtual-time account per server: each finished test charges its elapsed
+time (scaled by the server's weight) to that server, and the next test
+is always dispatched for the server with the least accumulated virtual
+time. Servers that respond quickly therefore keep flowing through the
+queue while a stalled one only ever holds the slots it is actively
+using.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+_DEFAULT_CONCURRENCY = 8
+
+TestFunc = Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+async def run_all(
+    urls: Iterable[str],
+    tests: Dict[str, TestFunc],
+    config: Optional[Dict[str, Any]] = None,
+    *,
+    concurrency: int = _DEFAULT_CONCURRENCY,
+    weights: Optional[Dict[str, float]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Run every (server, test) pair and return {url: {test_name: result}}.
+
+    Concurrency is bounded by a semaphore; dispatch order follows the
+    least-virtual-time rule described in the module docstring. A higher
+    weight for a server makes its runtime count for less, giving it a
+    proportionally larger share of the slots. Exceptions escaping a test
+    are folded into a standard failure result instead of cancelling the
+    rest of the matrix.
+    """
+    urls = list(urls)
+    config = config if config is not None else {}
+    weights = weights if weights is not None else {}
+
+    sem = asyncio.Semaphore(concurrency)
+    virtual_time = {url: 0.0 for url in urls}
+    queues = {url: list(tests.items()) for url in urls}
+    results: Dict[str, Dict[str, Any]] = {url: {} for url in urls}
+
+    async def _run(url: str, name: str, func: TestFunc) -> None:
+        start = time.perf_counter()
+        try:
+            results[url][name] = await func(url, config)
+        except Exception as e:
+            results[url][name] = {"success": False, "error": str(e)}
+        finally:
+            elapsed = time.perf_counter() - start
+            virtual_time[url] += elapsed / weights.get(url, 1.0)
+            sem.release()
+
+    pending = []
+    while any(queues.values()):
+        # Waiting for a slot before choosing lets finished tests update
+        # the virtual clocks first, so the pick reflects actual runtimes
+        await sem.acquire()
+        url = min(
+            (u for u in urls if queues[u]),
+            key=lambda u: virtual_time[u],
+            default=None,
+        )
+        if url is None:
+            sem.release()
+            break
+        name, func = queues[url].pop(0)
+        pending.append(asyncio.create_task(_run(url, name, func)))
+
+    if pending:
+        await asyncio.gather(*pending)
+    return results
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Slotted record types shared by the MCP compatibility test scripts.
+
+Plain dicts carry a couple hundred bytes of overhead each; slotted
+dataclasses keep batch runs lean. Records are converted back to plain
+dicts only at the return boundary where the JSON report is built.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(slots=True)
+class Results:
+    """Per-test counters mirrored into the "results" report field."""
+
+    connected: bool = False
+    initialized: bool = False
+    tools_found: int = 0
+    resources_accessible: int = 0
+    messages_exchanged: int = 0
+    errors_encountered: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "connected": self.connected,
+            "initialized": self.initialized,
+            "tools_found": self.tools_found,
+            "resources_accessible": self.resources_accessible,
+            "messages_exchanged": self.messages_exchanged,
+            "errors_encountered": self.errors_encountered,
+        }
+
+
+@dataclass(slots=True)
+class Issue:
+    """A single reported issue; stack_trace is only set for failures."""
+
+    severity: str
+    category: str
+    description: str
+    stack_trace: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        issue = {
+            "severity": self.severity,
+            "category": self.category,
+            "description": self.description,
+        }
+        if self.stack_trace is not None:
+            issue["stack_trace"] = self.stack_trace
+        return issue
+
+
+def issues_to_dicts(issues: List[Issue]) -> List[Dict[str, Any]]:
+    """Convert accumulated Issue records for the JSON report."""
+    return [issue.to_dict() for issue in issues]
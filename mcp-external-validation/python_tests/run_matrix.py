@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Run the compatibility tests against many MCP servers at once.
+
+Replaces the serial shell loop over run_test.py invocations: all
+(server, test) pairs run inside one event loop with bounded
+parallelism, so total runtime drops from N * per-test to roughly
+ceil(N / parallelism) * per-test. Every run shares the pooled
+ClientSession from _client, keeping connections warm across servers.
+"""
+
+import argparse
+from typing import Any, Dict, Iterable, Optional
+
+from _client import run as run_with_session
+from _scheduler import run_all
+from run_test import _TEST_MODULES, _write_result, run_test
+
+_DEFAULT_TESTS = (
+    "tool_execution",
+    "resource_access",
+    "transport_compat",
+    "error_handling",
+)
+
+_DEFAULT_PARALLEL = 8
+
+
+def _make_test(test_type: str):
+    """Adapt a test type to the (url, config) callable run_all expects."""
+
+    async def _invoke(url: str, config: Dict[str, Any]) -> Dict[str, Any]:
+        return await run_test(
+            {"server_url": url, "test_type": test_type, "config": config}
+        )
+
+    return _invoke
+
+
+async def run_many(
+    urls: Iterable[str],
+    test_types: Iterable[str] = _DEFAULT_TESTS,
+    config: Optional[Dict[str, Any]] = None,
+    *,
+    parallel: int = _DEFAULT_PARALLEL,
+) -> Dict[str, Dict[str, Any]]:
+    """Run the given test types against every URL concurrently.
+
+    Dispatch goes through the weighted-fair scheduler so a slow server
+    cannot starve the rest of the matrix. Returns {url: {test: result}}.
+    """
+    tests = {name: _make_test(name) for name in test_types}
+    return await run_all(urls, tests, config or {}, concurrency=parallel)
+
+
+def main():
+    """Main entry point for the matrix runner."""
+    parser = argparse.ArgumentParser(
+        description="Run MCP compatibility tests against several servers"
+    )
+    parser.add_argument("urls", nargs="+", help="MCP server URLs")
+    parser.add_argument(
+        "--tests",
+        default=",".join(_DEFAULT_TESTS),
+        help="Comma-separated test types to run",
+    )
+    parser.add_argument("--parallel", type=int, default=_DEFAULT_PARALLEL)
+    parser.add_argument("--timeout", type=int, default=30)
+    parser.add_argument(
+        "--force", action="store_true", help="Bypass the local result cache"
+    )
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    test_types = [name.strip() for name in args.tests.split(",") if name.strip()]
+    unknown = [name for name in test_types if name not in _TEST_MODULES]
+    if unknown:
+        parser.error(f"unknown test types: {', '.join(unknown)}")
+
+    config = {"timeout": args.timeout, "force": args.force}
+    results = run_with_session(
+        run_many(args.urls, test_types, config, parallel=args.parallel)
+    )
+    _write_result(results, indent=args.verbose)
+
+
+if __name__ == "__main__":
+    main()
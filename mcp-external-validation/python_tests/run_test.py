@@ -1,23 +1,41 @@
 #!/usr/bin/env python3
 """Test runner for MCP Python SDK compatibility tests."""
 
-import asyncio
 import importlib
 import json
 import sys
-import traceback
-from typing import Any, Dict
+import types
+from typing import Any, Callable, Dict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _write_result(obj: Any, indent: bool = False) -> None:
+    """Stream a JSON result to stdout without an intermediate string."""
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        sys.stdout.buffer.write(orjson.dumps(obj, option=option))
+        sys.stdout.buffer.flush()
+    else:
+        json.dump(obj, sys.stdout, indent=2 if indent else None)
+        sys.stdout.write("\n")
 
 
-async def run_test(test_request: Dict[str, Any]) -> Dict[str, Any]:
-    """Run a specific test based on the request."""
+def _loads(data: str) -> Any:
+    """Parse JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data.encode())
+    return json.loads(data)
 
-    server_url = test_request["server_url"]
-    test_type = test_request["test_type"]
-    config = test_request["config"]
 
-    # Map test types to modules
-    test_modules = {
+# Map test types to modules; frozen so the dict is built once per process
+_TEST_MODULES = types.MappingProxyType(
+    {
         "basic_connection": "test_basic_connection",
         "tool_execution": "test_tool_execution",
         "resource_access": "test_resource_access",
@@ -27,8 +45,50 @@ async def run_test(test_request: Dict[str, Any]) -> Dict[str, Any]:
         "notifications": "test_notifications",
         "oauth_auth": "test_oauth_auth",
     }
+)
+
+# Resolved test functions, keyed by test type, so repeated invocations in the
+# same process skip the importlib machinery.
+_TEST_FUNC_CACHE: Dict[str, Callable] = {}
+
+# Static response fragments, built once at import; error paths copy and
+# overlay these instead of rebuilding the nested dicts on every call.
+_PY_VERSION = sys.version.split()[0]
+
+_DEFAULT_RESULTS = {
+    "connected": False,
+    "initialized": False,
+    "tools_found": 0,
+    "resources_accessible": 0,
+    "messages_exchanged": 0,
+    "errors_encountered": 1,
+}
+
+_FEATURES_STDIO_ONLY = {
+    "sse_transport": False,
+    "websocket_transport": False,
+    "stdio_transport": True,
+    "oauth_support": False,
+    "sampling_support": False,
+    "logging_levels": True,
+}
+
+_COMPAT_UNKNOWN = {
+    "sdk_version": "unknown",
+    "python_version": _PY_VERSION,
+    "protocol_versions": [],
+    "features": {},
+}
 
-    if test_type not in test_modules:
+
+async def run_test(test_request: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a specific test based on the request."""
+
+    server_url = test_request["server_url"]
+    test_type = test_request["test_type"]
+    config = test_request["config"]
+
+    if test_type not in _TEST_MODULES:
         return {
             "success": False,
             "duration_ms": 0,
@@ -41,26 +101,26 @@ async def run_test(test_request: Dict[str, Any]) -> Dict[str, Any]:
                     "description": f"Test type '{test_type}' not found",
                 }
             ],
-            "compatibility": {
-                "sdk_version": "unknown",
-                "python_version": sys.version.split()[0],
-                "protocol_versions": [],
-                "features": {},
-            },
+            "compatibility": dict(_COMPAT_UNKNOWN),
         }
 
     try:
-        # Import the test module
-        module_name = test_modules[test_type]
-        module = importlib.import_module(module_name)
+        module_name = _TEST_MODULES[test_type]
+
+        if test_type in _TEST_FUNC_CACHE:
+            test_func = _TEST_FUNC_CACHE[test_type]
+        else:
+            # Import the test module
+            module = importlib.import_module(module_name)
 
-        # Get the test function
-        test_func_name = f"test_{test_type}"
-        if not hasattr(module, test_func_name):
-            # Fallback to generic test function
-            test_func_name = "run_test"
+            # Get the test function
+            test_func_name = f"test_{test_type}"
+            if not hasattr(module, test_func_name):
+                # Fallback to generic test function
+                test_func_name = "run_test"
 
-        test_func = getattr(module, test_func_name)
+            test_func = getattr(module, test_func_name)
+            _TEST_FUNC_CACHE[test_type] = test_func
 
         # Run the test
         result = await test_func(server_url, config)
@@ -71,14 +131,7 @@ async def run_test(test_request: Dict[str, Any]) -> Dict[str, Any]:
         return {
             "success": False,
             "duration_ms": 0,
-            "results": {
-                "connected": False,
-                "initialized": False,
-                "tools_found": 0,
-                "resources_accessible": 0,
-                "messages_exchanged": 0,
-                "errors_encountered": 1,
-            },
+            "results": dict(_DEFAULT_RESULTS),
             "error": f"Test module not found: {module_name}",
             "issues": [
                 {
@@ -88,32 +141,20 @@ async def run_test(test_request: Dict[str, Any]) -> Dict[str, Any]:
                 }
             ],
             "compatibility": {
-                "sdk_version": "unknown",
-                "python_version": sys.version.split()[0],
+                **_COMPAT_UNKNOWN,
                 "protocol_versions": ["2024-11-05"],
-                "features": {
-                    "sse_transport": False,
-                    "websocket_transport": False,
-                    "stdio_transport": True,
-                    "oauth_support": False,
-                    "sampling_support": False,
-                    "logging_levels": True,
-                },
+                "features": dict(_FEATURES_STDIO_ONLY),
             },
         }
 
     except Exception as e:
+        # Only pay for traceback formatting when actually reporting a failure
+        import traceback
+
         return {
             "success": False,
             "duration_ms": 0,
-            "results": {
-                "connected": False,
-                "initialized": False,
-                "tools_found": 0,
-                "resources_accessible": 0,
-                "messages_exchanged": 0,
-                "errors_encountered": 1,
-            },
+            "results": dict(_DEFAULT_RESULTS),
             "error": str(e),
             "issues": [
                 {
@@ -123,12 +164,7 @@ async def run_test(test_request: Dict[str, Any]) -> Dict[str, Any]:
                     "stack_trace": traceback.format_exc(),
                 }
             ],
-            "compatibility": {
-                "sdk_version": "unknown",
-                "python_version": sys.version.split()[0],
-                "protocol_versions": [],
-                "features": {},
-            },
+            "compatibility": dict(_COMPAT_UNKNOWN),
         }
 
 
@@ -140,8 +176,8 @@ def main():
         # Read JSON request from stdin
         try:
             request_data = sys.stdin.read()
-            test_request = json.loads(request_data)
-        except json.JSONDecodeError as e:
+            test_request = _loads(request_data)
+        except ValueError as e:
             result = {
                 "success": False,
                 "error": f"Invalid JSON input: {e}",
@@ -149,7 +185,7 @@ def main():
                 "issues": [],
                 "compatibility": {},
             }
-            print(json.dumps(result))
+            _write_result(result)
             sys.exit(1)
     else:
         # Command line mode (for debugging)
@@ -174,11 +210,13 @@ def main():
             },
         }
 
-    # Run the test
-    result = asyncio.run(run_test(test_request))
+    # Run the test, closing the shared HTTP session before the loop exits
+    from _client import run as run_with_session
+
+    result = run_with_session(run_test(test_request))
 
     # Output result as JSON
-    print(json.dumps(result, indent=2 if "--verbose" in sys.argv else None))
+    _write_result(result, indent="--verbose" in sys.argv)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Single-process driver for the resource, tool and transport suites.
+
+Running the three scripts separately means three processes, three
+ClientSessions and three handshakes against the same server. Here the
+suites share one event loop and the pooled ClientSession, and a single
+up-front initialize verifies the server before any suite runs — a dead
+or misbehaving server fails once instead of three times. The per-suite
+initializes that remain ride inside already-pipelined batches, so they
+add no extra round-trips on the warm connection.
+"""
+
+import argparse
+import asyncio
+from typing import Any, Dict, Optional
+
+from _client import encode, get_session, post_rpc, request_timeout
+from _client import run as run_with_session
+from _types import Issue, Results, issues_to_dicts
+from run_test import _write_result
+from test_resource_access import test_resource_access
+from test_tool_execution import test_tool_execution
+from test_transport_compat import test_transport_compat
+
+_INIT_REQUEST = {
+    "jsonrpc": "2.0",
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "mcp-python-test", "version": "1.0.0"},
+    },
+    "id": 1,
+}
+_INIT_BODY = encode(_INIT_REQUEST)
+
+_TESTS = (
+    ("resource_access", test_resource_access),
+    ("tool_execution", test_tool_execution),
+    ("transport_compat", test_transport_compat),
+)
+
+
+async def run_all_tests(
+    server_url: str, config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Run all three suites against one server; returns {test: result}.
+
+    The shared initialize acts as a gate: if it fails, every suite gets
+    the same failure envelope without touching the network again. On
+    success the suites run concurrently on the warm session.
+    """
+    config = config if config is not None else {}
+
+    results = Results()
+    issues = []
+    try:
+        session = await get_session()
+        init_response = await post_rpc(
+            session,
+            server_url,
+            _INIT_BODY,
+            results,
+            issues,
+            category="initialize",
+            timeout=request_timeout(config),
+        )
+    except Exception as e:
+        init_response = None
+        results.errors_encountered += 1
+        issues.append(
+            Issue(severity="error", category="initialize", description=str(e))
+        )
+    if init_response is None:
+        failure = {
+            "success": False,
+            "duration_ms": 0,
+            "results": results.to_dict(),
+            "error": "Initialize failed",
+            "issues": issues_to_dicts(issues),
+        }
+        return {name: failure for name, _ in _TESTS}
+
+    outcomes = await asyncio.gather(*(func(server_url, config) for _, func in _TESTS))
+    return {name: outcome for (name, _), outcome in zip(_TESTS, outcomes)}
+
+
+def main():
+    """Main entry point for the combined runner."""
+    parser = argparse.ArgumentParser(
+        description="Run the resource, tool and transport suites in one process"
+    )
+    parser.add_argument("server_url", help="MCP server URL")
+    parser.add_argument("--timeout", type=int, default=30)
+    parser.add_argument(
+        "--force", action="store_true", help="Bypass the local result cache"
+    )
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    config = {"timeout": args.timeout, "force": args.force}
+    result = run_with_session(run_all_tests(args.server_url, config))
+    _write_result(result, indent=args.verbose)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,18 @@
 import asyncio
 import json
 import sys
+import time
 from typing import Any, Dict
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+import _cache
+from _client import PY_VERSION, get_session, read_json
+from _types import Issue, Results, issues_to_dicts
+
 try:
     from mcp import ClientSession, StdioServerParameters
     from mcp.client.session import ClientSession
@@ -36,20 +46,34 @@ except ImportError:
     sys.exit(1)
 
 
+_sdk_version = None
+
+
+def _resolve_sdk_version() -> str:
+    """Look up the installed MCP SDK version once and memoize it."""
+    global _sdk_version
+    if _sdk_version is None:
+        try:
+            import mcp
+
+            _sdk_version = getattr(mcp, "__version__", "unknown")
+        except:
+            _sdk_version = "unknown"
+    return _sdk_version
+
+
 async def test_basic_connection(
     server_url: str, config: Dict[str, Any]
 ) -> Dict[str, Any]:
     """Test basic connection to MCP server."""
 
-    start_time = asyncio.get_event_loop().time()
-    results = {
-        "connected": False,
-        "initialized": False,
-        "tools_found": 0,
-        "resources_accessible": 0,
-        "messages_exchanged": 0,
-        "errors_encountered": 0,
-    }
+    if not config.get("force"):
+        cached = _cache.get(server_url, "2024-11-05", "basic_connection")
+        if cached is not None:
+            return cached
+
+    start_time = time.perf_counter()
+    results = Results()
     issues = []
 
     try:
@@ -59,106 +83,96 @@ async def test_basic_connection(
             server_params = StdioServerParameters(command=server_url[8:], args=[])
             async with stdio_client(server_params) as (read, write):
                 async with ClientSession(read, write) as session:
-                    results["connected"] = True
+                    results.connected = True
 
                     # Initialize session
                     await session.initialize()
-                    results["initialized"] = True
-                    results["messages_exchanged"] += 2  # init request + response
-
-                    # List tools
-                    tools_response = await session.list_tools()
-                    results["tools_found"] = len(tools_response.tools)
-                    results["messages_exchanged"] += 2
-
-                    # List resources
-                    resources_response = await session.list_resources()
-                    results["resources_accessible"] = len(resources_response.resources)
-                    results["messages_exchanged"] += 2
+                    results.initialized = True
+                    results.messages_exchanged += 2  # init request + response
+
+                    # List tools and resources concurrently; both only
+                    # depend on the session being initialized
+                    tools_response, resources_response = await asyncio.gather(
+                        session.list_tools(), session.list_resources()
+                    )
+                    results.tools_found = len(tools_response.tools)
+                    results.resources_accessible = len(resources_response.resources)
+                    results.messages_exchanged += 4
 
         else:
             # HTTP/WebSocket transport
             # For now, we'll use a simplified HTTP client approach
-            import aiohttp
-
-            async with aiohttp.ClientSession() as http_session:
-                # Test connection with initialize request
-                init_request = {
-                    "jsonrpc": "2.0",
-                    "method": "initialize",
-                    "params": {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": {},
-                        "clientInfo": {"name": "mcp-python-test", "version": "1.0.0"},
-                    },
-                    "id": 1,
-                }
-
-                async with http_session.post(
-                    server_url,
-                    json=init_request,
-                    timeout=aiohttp.ClientTimeout(total=config.get("timeout", 30)),
-                ) as response:
-                    if response.status == 200:
-                        results["connected"] = True
-                        data = await response.json()
-                        if "result" in data:
-                            results["initialized"] = True
-                            results["messages_exchanged"] += 2
-                    else:
-                        results["errors_encountered"] += 1
-                        issues.append(
-                            {
-                                "severity": "error",
-                                "category": "connection",
-                                "description": f"HTTP {response.status}: Failed to initialize",
-                            }
+            http_session = await get_session()
+
+            # Test connection with initialize request
+            init_request = {
+                "jsonrpc": "2.0",
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": "2024-11-05",
+                    "capabilities": {},
+                    "clientInfo": {"name": "mcp-python-test", "version": "1.0.0"},
+                },
+                "id": 1,
+            }
+
+            async with http_session.post(
+                server_url,
+                json=init_request,
+                timeout=aiohttp.ClientTimeout(total=config.get("timeout", 30)),
+            ) as response:
+                if response.status == 200:
+                    results.connected = True
+                    data = await read_json(response)
+                    if "result" in data:
+                        results.initialized = True
+                        results.messages_exchanged += 2
+                else:
+                    results.errors_encountered += 1
+                    issues.append(
+                        Issue(
+                            severity="error",
+                            category="connection",
+                            description=f"HTTP {response.status}: Failed to initialize",
                         )
+                    )
 
     except asyncio.TimeoutError:
-        results["errors_encountered"] += 1
+        results.errors_encountered += 1
         issues.append(
-            {
-                "severity": "error",
-                "category": "timeout",
-                "description": "Connection timed out",
-            }
+            Issue(
+                severity="error",
+                category="timeout",
+                description="Connection timed out",
+            )
         )
     except Exception as e:
-        results["errors_encountered"] += 1
+        # Only pay for traceback formatting when actually reporting a failure
+        import traceback
+
+        results.errors_encountered += 1
         issues.append(
-            {
-                "severity": "error",
-                "category": "connection",
-                "description": str(e),
-                "stack_trace": (
-                    traceback.format_exc() if "traceback" in globals() else None
-                ),
-            }
+            Issue(
+                severity="error",
+                category="connection",
+                description=str(e),
+                stack_trace=traceback.format_exc(),
+            )
         )
 
-    duration_ms = int((asyncio.get_event_loop().time() - start_time) * 1000)
+    duration_ms = int((time.perf_counter() - start_time) * 1000)
 
-    # Get SDK version
-    sdk_version = "unknown"
-    try:
-        import mcp
-
-        sdk_version = getattr(mcp, "__version__", "unknown")
-    except:
-        pass
-
-    return {
-        "success": results["initialized"] and results["errors_encountered"] == 0,
+    result = {
+        "success": results.initialized and results.errors_encountered == 0,
         "duration_ms": duration_ms,
-        "results": results,
+        "results": results.to_dict(),
         "error": (
-            None if results["errors_encountered"] == 0 else "Connection test failed"
+            None if results.errors_encountered == 0 else "Connection test failed"
         ),
-        "issues": issues,
+        "issues": issues_to_dicts(issues),
         "compatibility": {
-            "sdk_version": sdk_version,
-            "python_version": sys.version.split()[0],
+            "sdk_version": _resolve_sdk_version(),
+            "python_version": PY_VERSION,
             "protocol_versions": ["2024-11-05"],
             "features": {
                 "sse_transport": False,
@@ -171,6 +185,12 @@ async def test_basic_connection(
         },
     }
 
+    if result["success"]:
+        # Failures are never cached; a transient outage should not
+        # mask a healthy server for the whole TTL window
+        _cache.put(server_url, "2024-11-05", "basic_connection", result)
+    return result
+
 
 if __name__ == "__main__":
     # For testing directly
@@ -179,8 +199,13 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("server_url", help="MCP server URL")
     parser.add_argument("--timeout", type=int, default=30)
+    parser.add_argument(
+        "--force", action="store_true", help="Bypass the local result cache"
+    )
     args = parser.parse_args()
 
-    config = {"timeout": args.timeout}
-    result = asyncio.run(test_basic_connection(args.server_url, config))
+    from _client import run as run_with_session
+
+    config = {"timeout": args.timeout, "force": args.force}
+    result = run_with_session(test_basic_connection(args.server_url, config))
     print(json.dumps(result, indent=2))
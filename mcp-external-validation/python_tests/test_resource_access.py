@@ -3,243 +3,271 @@
 
 import asyncio
 import json
-import sys
+import time
 import traceback
 from typing import Any, Dict, List
 
+import _cache
+from _client import (
+    JSON_HEADERS,
+    MISSING,
+    PY_VERSION,
+    encode,
+    get_session,
+    post_rpc_batch,
+    read_pointer,
+    request_timeout,
+    stream_array_summary,
+)
+from _types import Issue, Results, issues_to_dicts
+
+# The init + list batch never varies, so it is encoded once at import;
+# each run posts the same bytes instead of rebuilding and re-serializing
+# the dicts
+_INIT_REQUEST = {
+    "jsonrpc": "2.0",
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "mcp-python-test", "version": "1.0.0"},
+    },
+    "id": 1,
+}
+_LIST_RESOURCES_REQUEST = {
+    "jsonrpc": "2.0",
+    "method": "resources/list",
+    "params": {},
+    "id": 2,
+}
+_INIT_LIST_BATCH_BODY = encode([_INIT_REQUEST, _LIST_RESOURCES_REQUEST])
+
+# Templates for the requests with a dynamic uri; shallow-merged per run
+_READ_TEMPLATE = {"jsonrpc": "2.0", "method": "resources/read", "id": 3}
+_SUBSCRIBE_TEMPLATE = {"jsonrpc": "2.0", "method": "resources/subscribe", "id": 4}
+
+# The compatibility block never varies for this test; built once and
+# shared across returns
+_BASE_COMPAT = {
+    "sdk_version": "1.0.0",  # Would get from actual SDK
+    "python_version": PY_VERSION,
+    "protocol_versions": ["2024-11-05"],
+    "features": {
+        "sse_transport": False,
+        "websocket_transport": False,
+        "stdio_transport": False,
+        "oauth_support": False,
+        "sampling_support": False,
+        "logging_levels": True,
+    },
+}
+
 
 async def test_resource_access(
     server_url: str, config: Dict[str, Any]
 ) -> Dict[str, Any]:
     """Test resource listing and access."""
 
-    start_time = asyncio.get_event_loop().time()
-    results = {
-        "connected": False,
-        "initialized": False,
-        "tools_found": 0,
-        "resources_accessible": 0,
-        "messages_exchanged": 0,
-        "errors_encountered": 0,
-    }
+    if not config.get("force"):
+        cached = _cache.get(server_url, "2024-11-05", "resource_access")
+        if cached is not None:
+            return cached
+
+    start_time = time.perf_counter()
+
+    # Per-exchange cap carved out of the run's --timeout budget
+    timeout = request_timeout(config)
+    results = Results()
     issues = []
 
     try:
         # For HTTP transport
-        import aiohttp
-
-        async with aiohttp.ClientSession() as session:
-            # Initialize connection
-            init_request = {
-                "jsonrpc": "2.0",
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {},
-                    "clientInfo": {"name": "mcp-python-test", "version": "1.0.0"},
-                },
-                "id": 1,
-            }
+        session = await get_session()
 
-            async with session.post(server_url, json=init_request) as response:
-                if response.status != 200:
-                    raise Exception(f"Initialize failed with status {response.status}")
+        # Initialize connection and list resources in one pipelined batch;
+        # the responses are demultiplexed by request id
+        async with asyncio.timeout(timeout), session.post(
+            server_url, data=_INIT_LIST_BATCH_BODY, headers=JSON_HEADERS
+        ) as response:
+            if response.status != 200:
+                raise Exception(f"Batch request failed with status {response.status}")
 
-                init_response = await response.json()
-                if "error" in init_response:
-                    raise Exception(f"Initialize error: {init_response['error']}")
+            # The init entry is tiny; pull it by pointer (batch order is
+            # not guaranteed, so locate it by request id). The resources
+            # array can be arbitrarily large, so it is streamed and
+            # counted instead of materialized into a Python list.
+            init_index = 0 if await read_pointer(response, "/0/id") == 1 else 1
+            init_response = await read_pointer(response, f"/{init_index}")
+            if init_response is None:
+                raise Exception("Initialize failed: no response in batch")
+            if "error" in init_response:
+                raise Exception(f"Initialize error: {init_response['error']}")
 
-                results["connected"] = True
-                results["initialized"] = True
-                results["messages_exchanged"] += 2
+            results.connected = True
+            results.initialized = True
+            results.messages_exchanged += 2
 
-            # List available resources
-            list_resources_request = {
-                "jsonrpc": "2.0",
-                "method": "resources/list",
-                "params": {},
-                "id": 2,
+            list_index = 1 - init_index
+            first_resource = None
+            if (
+                await read_pointer(response, f"/{list_index}/result/resources", MISSING)
+                is MISSING
+            ):
+                results.errors_encountered += 1
+                issues.append(
+                    Issue(
+                        severity="error",
+                        category="resources",
+                        description="Invalid resources/list response format",
+                    )
+                )
+            else:
+                first_resource, resource_count = await stream_array_summary(
+                    response, "item.result.resources.item"
+                )
+                results.resources_accessible = resource_count
+                results.messages_exchanged += 2
+
+                if resource_count == 0:
+                    issues.append(
+                        Issue(
+                            severity="info",
+                            category="resources",
+                            description="No resources found on server",
+                        )
+                    )
+
+        # Test reading + subscribing to the first resource (if any); both
+        # depend on the listing, so they form a second pipelined batch
+        if first_resource is not None:
+            resource_uri = first_resource.get("uri", "")
+
+            read_resource_request = {
+                **_READ_TEMPLATE,
+                "params": {"uri": resource_uri},
+            }
+            subscribe_request = {
+                **_SUBSCRIBE_TEMPLATE,
+                "params": {"uri": resource_uri},
             }
 
-            resources = []
-            async with session.post(
-                server_url, json=list_resources_request
-            ) as response:
-                if response.status == 200:
-                    resources_response = await response.json()
-                    if (
-                        "result" in resources_response
-                        and "resources" in resources_response["result"]
-                    ):
-                        resources = resources_response["result"]["resources"]
-                        results["resources_accessible"] = len(resources)
-                        results["messages_exchanged"] += 2
-
-                        if len(resources) == 0:
+            responses = await post_rpc_batch(
+                session,
+                server_url,
+                [read_resource_request, subscribe_request],
+                timeout=timeout,
+            )
+
+            read_response = responses.get(3)
+            if read_response is None:
+                results.errors_encountered += 1
+                issues.append(
+                    Issue(
+                        severity="error",
+                        category="resource_access",
+                        description="Resource read failed: no response in batch",
+                    )
+                )
+            else:
+                results.messages_exchanged += 2
+
+                if "error" in read_response:
+                    results.errors_encountered += 1
+                    issues.append(
+                        Issue(
+                            severity="warning",
+                            category="resource_access",
+                            description=f"Resource read error: {read_response['error'].get('message', 'Unknown error')}",
+                        )
+                    )
+                elif (
+                    "result" in read_response and "contents" in read_response["result"]
+                ):
+                    # Successfully read resource
+                    contents = read_response["result"]["contents"]
+                    if isinstance(contents, list) and len(contents) > 0:
+                        # Check content format
+                        first_content = contents[0]
+                        if "uri" not in first_content or "text" not in first_content:
                             issues.append(
-                                {
-                                    "severity": "info",
-                                    "category": "resources",
-                                    "description": "No resources found on server",
-                                }
+                                Issue(
+                                    severity="warning",
+                                    category="resource_format",
+                                    description="Resource content missing required fields",
+                                )
                             )
-                    else:
-                        results["errors_encountered"] += 1
-                        issues.append(
-                            {
-                                "severity": "error",
-                                "category": "resources",
-                                "description": "Invalid resources/list response format",
-                            }
-                        )
                 else:
-                    results["errors_encountered"] += 1
+                    results.errors_encountered += 1
                     issues.append(
-                        {
-                            "severity": "error",
-                            "category": "resources",
-                            "description": f"Failed to list resources: HTTP {response.status}",
-                        }
+                        Issue(
+                            severity="error",
+                            category="resource_access",
+                            description="Invalid resource read response format",
+                        )
                     )
 
-            # Test reading the first resource (if any)
-            if resources:
-                first_resource = resources[0]
-                resource_uri = first_resource.get("uri", "")
-
-                # Read resource
-                read_resource_request = {
-                    "jsonrpc": "2.0",
-                    "method": "resources/read",
-                    "params": {"uri": resource_uri},
-                    "id": 3,
-                }
-
-                async with session.post(
-                    server_url, json=read_resource_request
-                ) as response:
-                    if response.status == 200:
-                        read_response = await response.json()
-                        results["messages_exchanged"] += 2
-
-                        if "error" in read_response:
-                            results["errors_encountered"] += 1
-                            issues.append(
-                                {
-                                    "severity": "warning",
-                                    "category": "resource_access",
-                                    "description": f"Resource read error: {read_response['error'].get('message', 'Unknown error')}",
-                                }
-                            )
-                        elif (
-                            "result" in read_response
-                            and "contents" in read_response["result"]
-                        ):
-                            # Successfully read resource
-                            contents = read_response["result"]["contents"]
-                            if isinstance(contents, list) and len(contents) > 0:
-                                # Check content format
-                                first_content = contents[0]
-                                if (
-                                    "uri" not in first_content
-                                    or "text" not in first_content
-                                ):
-                                    issues.append(
-                                        {
-                                            "severity": "warning",
-                                            "category": "resource_format",
-                                            "description": "Resource content missing required fields",
-                                        }
-                                    )
-                        else:
-                            results["errors_encountered"] += 1
-                            issues.append(
-                                {
-                                    "severity": "error",
-                                    "category": "resource_access",
-                                    "description": "Invalid resource read response format",
-                                }
+            subscribe_response = responses.get(4)
+            if subscribe_response is not None:
+                results.messages_exchanged += 2
+
+                if "error" in subscribe_response:
+                    # Subscription not supported is okay
+                    if subscribe_response["error"].get("code") == -32601:
+                        issues.append(
+                            Issue(
+                                severity="info",
+                                category="resource_subscription",
+                                description="Resource subscription not supported",
                             )
+                        )
                     else:
-                        results["errors_encountered"] += 1
                         issues.append(
-                            {
-                                "severity": "error",
-                                "category": "resource_access",
-                                "description": f"Resource read failed: HTTP {response.status}",
-                            }
+                            Issue(
+                                severity="warning",
+                                category="resource_subscription",
+                                description=f"Subscription error: {subscribe_response['error'].get('message', 'Unknown')}",
+                            )
                         )
 
-                # Test resource subscription
-                subscribe_request = {
-                    "jsonrpc": "2.0",
-                    "method": "resources/subscribe",
-                    "params": {"uri": resource_uri},
-                    "id": 4,
-                }
-
-                async with session.post(server_url, json=subscribe_request) as response:
-                    if response.status == 200:
-                        subscribe_response = await response.json()
-                        results["messages_exchanged"] += 2
-
-                        if "error" in subscribe_response:
-                            # Subscription not supported is okay
-                            if subscribe_response["error"].get("code") == -32601:
-                                issues.append(
-                                    {
-                                        "severity": "info",
-                                        "category": "resource_subscription",
-                                        "description": "Resource subscription not supported",
-                                    }
-                                )
-                            else:
-                                issues.append(
-                                    {
-                                        "severity": "warning",
-                                        "category": "resource_subscription",
-                                        "description": f"Subscription error: {subscribe_response['error'].get('message', 'Unknown')}",
-                                    }
-                                )
-
+    except asyncio.TimeoutError:
+        results.errors_encountered += 1
+        issues.append(
+            Issue(
+                severity="error",
+                category="timeout",
+                description="Connection timed out",
+            )
+        )
     except Exception as e:
-        results["errors_encountered"] += 1
+        results.errors_encountered += 1
         issues.append(
-            {
-                "severity": "error",
-                "category": "execution",
-                "description": str(e),
-                "stack_trace": traceback.format_exc(),
-            }
+            Issue(
+                severity="error",
+                category="execution",
+                description=str(e),
+                stack_trace=traceback.format_exc(),
+            )
         )
 
-    duration_ms = int((asyncio.get_event_loop().time() - start_time) * 1000)
+    duration_ms = int((time.perf_counter() - start_time) * 1000)
 
-    return {
-        "success": results["initialized"] and results["errors_encountered"] == 0,
+    result = {
+        "success": results.initialized and results.errors_encountered == 0,
         "duration_ms": duration_ms,
-        "results": results,
+        "results": results.to_dict(),
         "error": (
-            None
-            if results["errors_encountered"] == 0
-            else "Resource access test failed"
+            None if results.errors_encountered == 0 else "Resource access test failed"
         ),
-        "issues": issues,
-        "compatibility": {
-            "sdk_version": "1.0.0",  # Would get from actual SDK
-            "python_version": sys.version.split()[0],
-            "protocol_versions": ["2024-11-05"],
-            "features": {
-                "sse_transport": False,
-                "websocket_transport": False,
-                "stdio_transport": False,
-                "oauth_support": False,
-                "sampling_support": False,
-                "logging_levels": True,
-            },
-        },
+        "issues": issues_to_dicts(issues),
+        "compatibility": _BASE_COMPAT,
     }
 
+    if result["success"]:
+        # Failures are never cached; a transient outage should not
+        # mask a healthy server for the whole TTL window
+        _cache.put(server_url, "2024-11-05", "resource_access", result)
+    return result
+
 
 if __name__ == "__main__":
     import argparse
@@ -247,8 +275,13 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("server_url", help="MCP server URL")
     parser.add_argument("--timeout", type=int, default=30)
+    parser.add_argument(
+        "--force", action="store_true", help="Bypass the local result cache"
+    )
     args = parser.parse_args()
 
-    config = {"timeout": args.timeout}
-    result = asyncio.run(test_resource_access(args.server_url, config))
+    from _client import run as run_with_session
+
+    config = {"timeout": args.timeout, "force": args.force}
+    result = run_with_session(test_resource_access(args.server_url, config))
     print(json.dumps(result, indent=2))
@@ -3,9 +3,63 @@
 
 import asyncio
 import json
-import sys
+import time
 import traceback
 from typing import Any, Dict, List
+from urllib.parse import urlsplit
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+import _cache
+from _client import (
+    PY_VERSION,
+    dumps,
+    encode,
+    get_session,
+    loads,
+    post_rpc,
+    request_timeout,
+)
+from _types import Issue, Results, issues_to_dicts
+
+# The initialize request is identical for every transport and every run;
+# encode it once at import in both the bytes (HTTP) and text (WebSocket)
+# framings
+_INIT_REQUEST = {
+    "jsonrpc": "2.0",
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {
+            "name": "mcp-python-transport-test",
+            "version": "1.0.0",
+        },
+    },
+    "id": 1,
+}
+_INIT_BODY = encode(_INIT_REQUEST)
+_INIT_TEXT = dumps(_INIT_REQUEST)
+
+# Scheme -> transport lookup; one hash instead of a startswith ladder
+_TRANSPORT_BY_SCHEME = {
+    "http": "http",
+    "https": "http",
+    "ws": "websocket",
+    "wss": "websocket",
+    "stdio": "stdio",
+}
+
+# Everything in the compatibility block except the probed features is
+# constant; the per-run dict overlays features onto this
+_BASE_COMPAT = {
+    "sdk_version": "1.0.0",  # Would get from actual SDK
+    "python_version": PY_VERSION,
+    "protocol_versions": ["2024-11-05"],
+}
 
 
 async def test_transport_compat(
@@ -13,183 +67,165 @@ async def test_transport_compat(
 ) -> Dict[str, Any]:
     """Test different transport methods compatibility."""
 
-    start_time = asyncio.get_event_loop().time()
-    results = {
-        "connected": False,
-        "initialized": False,
-        "tools_found": 0,
-        "resources_accessible": 0,
-        "messages_exchanged": 0,
-        "errors_encountered": 0,
-    }
+    if not config.get("force"):
+        cached = _cache.get(server_url, "2024-11-05", "transport_compat")
+        if cached is not None:
+            return cached
+
+    start_time = time.perf_counter()
+
+    # Per-exchange cap carved out of the run's --timeout budget
+    timeout = request_timeout(config)
+    results = Results()
     issues = []
     transports_tested = []
 
     try:
-        # Determine transport type from URL
-        if server_url.startswith("http://") or server_url.startswith("https://"):
-            transport_type = "http"
-        elif server_url.startswith("ws://") or server_url.startswith("wss://"):
-            transport_type = "websocket"
-        elif server_url.startswith("stdio://"):
-            transport_type = "stdio"
-        else:
-            transport_type = "unknown"
+        # Determine transport type from the URL scheme
+        transport_type = _TRANSPORT_BY_SCHEME.get(
+            urlsplit(server_url).scheme, "unknown"
+        )
 
         transports_tested.append(transport_type)
 
         if transport_type == "http":
             # Test HTTP/SSE transport
-            import aiohttp
-
-            async with aiohttp.ClientSession() as session:
-                # Test standard HTTP request-response
-                init_request = {
-                    "jsonrpc": "2.0",
-                    "method": "initialize",
-                    "params": {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": {},
-                        "clientInfo": {
-                            "name": "mcp-python-transport-test",
-                            "version": "1.0.0",
-                        },
-                    },
-                    "id": 1,
-                }
-
-                async with session.post(server_url, json=init_request) as response:
-                    if response.status == 200:
-                        results["connected"] = True
-                        init_response = await response.json()
-                        if "result" in init_response:
-                            results["initialized"] = True
-                            results["messages_exchanged"] += 2
-                        else:
-                            issues.append(
-                                {
-                                    "severity": "error",
-                                    "category": "http_transport",
-                                    "description": "Invalid initialization response",
-                                }
-                            )
-                    else:
-                        results["errors_encountered"] += 1
-                        issues.append(
-                            {
-                                "severity": "error",
-                                "category": "http_transport",
-                                "description": f"HTTP transport failed with status {response.status}",
-                            }
-                        )
+            session = await get_session()
+
+            sse_url = server_url.rstrip("/") + "/sse"
 
-                # Test SSE endpoint if available
-                sse_url = server_url.rstrip("/") + "/sse"
+            async def _probe_sse() -> bool:
                 try:
-                    async with session.get(sse_url) as response:
-                        if response.status == 200:
-                            issues.append(
-                                {
-                                    "severity": "info",
-                                    "category": "sse_transport",
-                                    "description": "SSE endpoint available",
-                                }
-                            )
-                            transports_tested.append("sse")
+                    async with asyncio.timeout(timeout):
+                        async with session.get(sse_url) as response:
+                            return response.status == 200
                 except:
                     # SSE not available
-                    pass
+                    return False
 
-        elif transport_type == "websocket":
-            # Test WebSocket transport
-            try:
-                import websockets
-
-                async with websockets.connect(server_url) as ws:
-                    results["connected"] = True
-
-                    # Send initialize
-                    init_request = {
-                        "jsonrpc": "2.0",
-                        "method": "initialize",
-                        "params": {
-                            "protocolVersion": "2024-11-05",
-                            "capabilities": {},
-                            "clientInfo": {
-                                "name": "mcp-python-transport-test",
-                                "version": "1.0.0",
-                            },
-                        },
-                        "id": 1,
-                    }
-
-                    await ws.send(json.dumps(init_request))
-                    response = await ws.recv()
-                    init_response = json.loads(response)
-
-                    if "result" in init_response:
-                        results["initialized"] = True
-                        results["messages_exchanged"] += 2
-                    else:
-                        issues.append(
-                            {
-                                "severity": "error",
-                                "category": "websocket_transport",
-                                "description": "Invalid initialization response",
-                            }
+            # The initialize request and the SSE probe are independent;
+            # firing them together costs max(RTT) instead of the sum.
+            # post_rpc records the status/error bookkeeping and returns
+            # None on failure.
+            init_response, sse_available = await asyncio.gather(
+                post_rpc(
+                    session,
+                    server_url,
+                    _INIT_BODY,
+                    results,
+                    issues,
+                    category="http_transport",
+                    timeout=timeout,
+                ),
+                _probe_sse(),
+            )
+            if init_response is not None:
+                results.connected = True
+                if "result" in init_response:
+                    results.initialized = True
+                else:
+                    issues.append(
+                        Issue(
+                            severity="error",
+                            category="http_transport",
+                            description="Invalid initialization response",
                         )
+                    )
 
-            except ImportError:
+            if sse_available:
                 issues.append(
-                    {
-                        "severity": "warning",
-                        "category": "websocket_transport",
-                        "description": "websockets library not installed",
-                    }
+                    Issue(
+                        severity="info",
+                        category="sse_transport",
+                        description="SSE endpoint available",
+                    )
                 )
-            except Exception as e:
-                results["errors_encountered"] += 1
+                transports_tested.append("sse")
+
+        elif transport_type == "websocket":
+            # Test WebSocket transport
+            if websockets is None:
                 issues.append(
-                    {
-                        "severity": "error",
-                        "category": "websocket_transport",
-                        "description": f"WebSocket transport failed: {str(e)}",
-                    }
+                    Issue(
+                        severity="warning",
+                        category="websocket_transport",
+                        description="websockets library not installed",
+                    )
                 )
+            else:
+                try:
+                    async with websockets.connect(server_url) as ws:
+                        results.connected = True
+
+                        # Send initialize
+                        await ws.send(_INIT_TEXT)
+                        response = await ws.recv()
+                        init_response = loads(response)
+
+                        if "result" in init_response:
+                            results.initialized = True
+                            results.messages_exchanged += 2
+                        else:
+                            issues.append(
+                                Issue(
+                                    severity="error",
+                                    category="websocket_transport",
+                                    description="Invalid initialization response",
+                                )
+                            )
+
+                except Exception as e:
+                    results.errors_encountered += 1
+                    issues.append(
+                        Issue(
+                            severity="error",
+                            category="websocket_transport",
+                            description=f"WebSocket transport failed: {str(e)}",
+                        )
+                    )
 
         elif transport_type == "stdio":
             # Test stdio transport
             issues.append(
-                {
-                    "severity": "info",
-                    "category": "stdio_transport",
-                    "description": "stdio transport testing requires special setup",
-                }
+                Issue(
+                    severity="info",
+                    category="stdio_transport",
+                    description="stdio transport testing requires special setup",
+                )
             )
             # Would need to spawn process and communicate via stdio
 
         else:
-            results["errors_encountered"] += 1
+            results.errors_encountered += 1
             issues.append(
-                {
-                    "severity": "error",
-                    "category": "transport",
-                    "description": f"Unknown transport type: {transport_type}",
-                }
+                Issue(
+                    severity="error",
+                    category="transport",
+                    description=f"Unknown transport type: {transport_type}",
+                )
             )
 
+    except asyncio.TimeoutError:
+        results.errors_encountered += 1
+        issues.append(
+            Issue(
+                severity="error",
+                category="timeout",
+                description="Connection timed out",
+            )
+        )
     except Exception as e:
-        results["errors_encountered"] += 1
+        results.errors_encountered += 1
         issues.append(
-            {
-                "severity": "error",
-                "category": "execution",
-                "description": str(e),
-                "stack_trace": traceback.format_exc(),
-            }
+            Issue(
+                severity="error",
+                category="execution",
+                description=str(e),
+                stack_trace=traceback.format_exc(),
+            )
         )
 
-    duration_ms = int((asyncio.get_event_loop().time() - start_time) * 1000)
+    duration_ms = int((time.perf_counter() - start_time) * 1000)
 
     # Determine feature support based on tests
     features = {
@@ -201,24 +237,25 @@ async def test_transport_compat(
         "logging_levels": True,  # Assume supported
     }
 
-    return {
-        "success": results["initialized"] and results["errors_encountered"] == 0,
+    result = {
+        "success": results.initialized and results.errors_encountered == 0,
         "duration_ms": duration_ms,
-        "results": results,
+        "results": results.to_dict(),
         "error": (
             None
-            if results["errors_encountered"] == 0
+            if results.errors_encountered == 0
             else "Transport compatibility test failed"
         ),
-        "issues": issues,
-        "compatibility": {
-            "sdk_version": "1.0.0",  # Would get from actual SDK
-            "python_version": sys.version.split()[0],
-            "protocol_versions": ["2024-11-05"],
-            "features": features,
-        },
+        "issues": issues_to_dicts(issues),
+        "compatibility": {**_BASE_COMPAT, "features": features},
     }
 
+    if result["success"]:
+        # Failures are never cached; a transient outage should not
+        # mask a healthy server for the whole TTL window
+        _cache.put(server_url, "2024-11-05", "transport_compat", result)
+    return result
+
 
 if __name__ == "__main__":
     import argparse
@@ -226,8 +263,13 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("server_url", help="MCP server URL")
     parser.add_argument("--timeout", type=int, default=30)
+    parser.add_argument(
+        "--force", action="store_true", help="Bypass the local result cache"
+    )
     args = parser.parse_args()
 
-    config = {"timeout": args.timeout}
-    result = asyncio.run(test_transport_compat(args.server_url, config))
+    from _client import run as run_with_session
+
+    config = {"timeout": args.timeout, "force": args.force}
+    result = run_with_session(test_transport_compat(args.server_url, config))
     print(json.dumps(result, indent=2))
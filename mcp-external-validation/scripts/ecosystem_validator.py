@@ -8,30 +8,81 @@ testing real-world implementations for compatibility with our framework.
 
 import argparse
 import asyncio
+import hashlib
 import json
 import logging
+import os
+import random
+import re
 import shutil
-import subprocess
 import sys
 import tempfile
 import time
-from dataclasses import asdict, dataclass
+from collections import defaultdict
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# Cap on buffered subprocess output; a misbehaving validator or server
+# cannot grow the Python heap without bound
+MAX_OUTPUT_BYTES = 16 * 1024 * 1024
+
+# How much of a server's most recent output to keep for diagnostics
+SERVER_OUTPUT_TAIL = 1024 * 1024
+
+# stderr markers that make a failed command worth retrying: network
+# flakes rather than genuine errors
+_TRANSIENT_MARKERS = re.compile(
+    r"timed? ?out|connection|network|temporar|could not resolve|rate limit",
+    re.IGNORECASE,
+)
+
+
+def _utcnow_iso() -> str:
+    """UTC timestamp in the report's fixed format.
+
+    An f-string over struct_time fields skips strftime's per-call format
+    parsing, which adds up when every result is stamped.
+    """
+    t = time.gmtime()
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z"
+    )
 
-@dataclass
+
+# Statuses that count as a successful validation
+SUCCESS_STATUSES = frozenset(("compliant", "passed"))
+
+# Persistent cache of bare repos, keyed by repo URL; re-validating the
+# ecosystem fetches deltas instead of re-downloading every repository
+REPO_CACHE_ROOT = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "mcp-ecosystem"
+)
+
+
+@dataclass(slots=True)
 class ValidationResult:
-    """Result of validating a single MCP server"""
+    """Result of validating a single MCP server.
+
+    Slotted because a full ecosystem run accumulates thousands of
+    instances; dropping the per-instance __dict__ shrinks each one and
+    speeds up the attribute reads in the report aggregation loop.
+    """
 
     server_name: str
     server_url: str
@@ -45,6 +96,19 @@ class ValidationResult:
     error_message: Optional[str] = None
 
 
+_RESULT_FIELDS = tuple(f.name for f in fields(ValidationResult))
+
+
+def _result_to_dict(result: ValidationResult) -> Dict:
+    """Plain-dict view of a result.
+
+    dataclasses.asdict recurses with deepcopy semantics; the fields here
+    are already plain JSON types, so a flat getattr walk over the cached
+    field names is all the serializers need.
+    """
+    return {name: getattr(result, name) for name in _RESULT_FIELDS}
+
+
 class EcosystemValidator:
     """Validates MCP servers across the ecosystem"""
 
@@ -53,6 +117,38 @@ class EcosystemValidator:
         self.max_concurrent = max_concurrent
         self.results: List[ValidationResult] = []
 
+        # Admission control for concurrent validations; a Condition plus
+        # counter instead of a Semaphore so the limit can be resized at
+        # runtime via set_max_concurrent
+        self._cv = asyncio.Condition()
+        self._active = 0
+
+        # Dependency installs are much heavier than validations; their
+        # own narrow gate keeps a batch of cold npm/pip installs from
+        # crowding out lightweight validation work
+        self._install_sem = asyncio.Semaphore(2)
+
+        # Discovery HTTP fan-out gets its own gate: tying it to
+        # max_concurrent would either throttle discovery or overload
+        # validation targets, depending on which way it is tuned
+        self._discover_sem = asyncio.Semaphore(16)
+
+        # Optional JSONL stream for incremental results, see
+        # open_incremental_report
+        self._report_fp = None
+
+        # Path to the validation binary; built once per run, see
+        # ensure_validator_built
+        self.validator_path = (
+            Path(__file__).parent.parent / "target" / "release" / "mcp-validate"
+        )
+        self._build_lock = asyncio.Lock()
+        self._build_done = False
+
+        # Shared HTTP session; created lazily so it binds to the running
+        # loop, see _http_session
+        self._http: Optional[aiohttp.ClientSession] = None
+
         # Known MCP implementations and their patterns
         self.known_implementations = {
             "anthropic": [
@@ -118,6 +214,63 @@ if __name__ == "__main__":
             }
         ]
 
+    async def _discover_github(
+        self, query: str = "topic:mcp-server", page_size: int = 100
+    ) -> List[Tuple[str, str]]:
+        """Discover MCP repositories via GitHub's GraphQL search.
+
+        One cursor-paged search query keeps discovery at O(pages) HTTP
+        round trips instead of one REST call per repository. Needs a
+        GITHUB_TOKEN in the environment; without one, only the known
+        implementation list is used.
+        """
+        token = os.environ.get("GITHUB_TOKEN")
+        if not token:
+            logger.debug("GITHUB_TOKEN not set; skipping GitHub discovery")
+            return []
+
+        graphql = """
+        query($q: String!, $n: Int!, $cursor: String) {
+          search(query: $q, type: REPOSITORY, first: $n, after: $cursor) {
+            pageInfo { hasNextPage endCursor }
+            nodes { ... on Repository { nameWithOwner url } }
+          }
+        }
+        """
+        session = await self._http_session()
+        discovered: List[Tuple[str, str]] = []
+        cursor = None
+        try:
+            while True:
+                async with self._discover_sem, session.post(
+                    "https://api.github.com/graphql",
+                    json={
+                        "query": graphql,
+                        "variables": {"q": query, "n": page_size, "cursor": cursor},
+                    },
+                    headers={"Authorization": f"Bearer {token}"},
+                ) as response:
+                    if response.status != 200:
+                        logger.warning(
+                            f"GitHub discovery failed with status {response.status}"
+                        )
+                        break
+                    payload = await response.json()
+
+                search = payload.get("data", {}).get("search", {})
+                for node in search.get("nodes", []):
+                    if node and node.get("nameWithOwner"):
+                        discovered.append((f"gh/{node['nameWithOwner']}", node["url"]))
+
+                page_info = search.get("pageInfo", {})
+                if not page_info.get("hasNextPage"):
+                    break
+                cursor = page_info.get("endCursor")
+        except aiohttp.ClientError as e:
+            logger.warning(f"GitHub discovery failed: {e}")
+
+        return discovered
+
     async def discover_servers(self) -> List[Tuple[str, str]]:
         """Discover MCP servers from various sources"""
         servers = []
@@ -128,34 +281,159 @@ if __name__ == "__main__":
                 name = f"{category}/{repo_url.split('/')[-1]}"
                 servers.append((name, repo_url))
 
-        # TODO: Add GitHub API search for MCP repositories
+        # Discovery sources run concurrently; a failing source only
+        # costs its own results. Known URLs win duplicates.
         # TODO: Add awesome-mcp list parsing
         # TODO: Add community registry lookup
+        source_results = await asyncio.gather(
+            self._discover_github(),
+            return_exceptions=True,
+        )
+
+        seen_urls = {repo_url for _, repo_url in servers}
+        for found in source_results:
+            if isinstance(found, Exception):
+                logger.warning(f"Discovery source failed: {found}")
+                continue
+            for name, repo_url in found:
+                if repo_url not in seen_urls:
+                    seen_urls.add(repo_url)
+                    servers.append((name, repo_url))
 
         logger.info(f"Discovered {len(servers)} servers to validate")
         return servers
 
+    async def _http_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use.
+
+        One long-lived session with a bounded connector keeps DNS and
+        TLS state warm across every HTTP call the validator makes and
+        caps file-descriptor usage under high max_concurrent, instead of
+        paying per-request session setup.
+        """
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_concurrent * 4,
+                    limit_per_host=8,
+                    ttl_dns_cache=300,
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    total=None, sock_connect=5, sock_read=self.timeout_seconds
+                ),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session; safe to call if none was created."""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+
+    async def _run_with_retry(
+        self,
+        argv: List[str],
+        *,
+        timeout: float,
+        attempts: int = 3,
+        base: float = 1.0,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, str]:
+        """Run a command, retrying transient failures with backoff.
+
+        A timeout or a non-zero exit whose stderr looks network-related
+        is retried up to attempts times, sleeping base * 2**i plus
+        jitter between tries; genuine failures return immediately. A
+        transient hiccup during clone or install therefore no longer
+        poisons a whole server result as setup_failed. Returns
+        (returncode, decoded stderr); timeouts report returncode -1.
+        """
+        returncode, text = -1, ""
+        for attempt in range(attempts):
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *argv,
+                    cwd=cwd,
+                    env=env,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                try:
+                    _, stderr = await asyncio.wait_for(
+                        proc.communicate(), timeout=timeout
+                    )
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    returncode, text = -1, f"timed out after {timeout:g}s"
+                else:
+                    returncode = proc.returncode
+                    text = stderr.decode(errors="replace")
+            except OSError as e:
+                returncode, text = -1, str(e)
+
+            if returncode == 0:
+                return 0, text
+            transient = returncode == -1 or _TRANSIENT_MARKERS.search(text)
+            if not transient or attempt == attempts - 1:
+                return returncode, text
+            delay = base * 2**attempt + random.uniform(0, 0.5)
+            logger.warning(f"Retrying {argv[0]} in {delay:.1f}s: {text.strip()[:200]}")
+            await asyncio.sleep(delay)
+        return returncode, text
+
+    async def _git(self, *args: str, timeout: float = 60) -> Tuple[int, str]:
+        """Run a git command, returning (returncode, decoded stderr)."""
+        return await self._run_with_retry(["git", *args], timeout=timeout)
+
     async def setup_test_environment(
         self, server_name: str, repo_url: str
     ) -> Optional[Dict]:
         """Set up a test environment for a server"""
+        temp_dir = None
         try:
-            # Create temporary directory
+            # Create temporary directory; it outlives this function (the
+            # server runs from it) and is removed by validate_implementation
             temp_dir = tempfile.mkdtemp(
                 prefix=f"mcp_test_{server_name.replace('/', '_')}_"
             )
 
-            # Clone repository
-            logger.info(f"Cloning {repo_url} to {temp_dir}")
-            result = subprocess.run(
-                ["git", "clone", "--depth", "1", repo_url, temp_dir],
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
+            # Sync the bare-repo cache: first run clones, later runs only
+            # fetch the delta instead of re-downloading the repository
+            cache_dir = REPO_CACHE_ROOT / hashlib.sha1(repo_url.encode()).hexdigest()
+            if cache_dir.exists():
+                logger.info(f"Fetching {repo_url} into cache {cache_dir}")
+                returncode, stderr = await self._git(
+                    "-C", str(cache_dir), "fetch", "--depth", "1", "origin"
+                )
+            else:
+                logger.info(f"Cloning {repo_url} into cache {cache_dir}")
+                cache_dir.parent.mkdir(parents=True, exist_ok=True)
+                returncode, stderr = await self._git(
+                    "clone", "--bare", "--depth", "1", repo_url, str(cache_dir)
+                )
 
-            if result.returncode != 0:
-                logger.error(f"Failed to clone {repo_url}: {result.stderr}")
+            if returncode != 0:
+                logger.error(f"Failed to sync {repo_url}: {stderr}")
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                return None
+
+            # Materialize a working tree from the cache. FETCH_HEAD only
+            # exists after a fetch; a fresh bare clone checks out HEAD.
+            ref = "FETCH_HEAD" if (cache_dir / "FETCH_HEAD").exists() else "HEAD"
+            returncode, stderr = await self._git(
+                "--git-dir",
+                str(cache_dir),
+                "worktree",
+                "add",
+                "--force",
+                "--detach",
+                temp_dir,
+                ref,
+            )
+            if returncode != 0:
+                logger.error(f"Failed to create worktree for {repo_url}: {stderr}")
                 shutil.rmtree(temp_dir, ignore_errors=True)
                 return None
 
@@ -163,64 +441,167 @@ if __name__ == "__main__":
             repo_path = Path(temp_dir)
             config = {
                 "path": temp_dir,
+                "cache_dir": str(cache_dir),
                 "type": "unknown",
                 "start_command": None,
                 "port": None,
             }
 
-            # Detect repository type and setup
-            if (repo_path / "package.json").exists():
+            # Detect repository type and setup from one directory scan
+            # instead of a stat() cascade per candidate file
+            entries = {entry.name: entry for entry in os.scandir(repo_path)}
+
+            if "package.json" in entries:
                 config["type"] = "node"
                 config["port"] = 3000
 
-                # Install dependencies
-                subprocess.run(["npm", "install"], cwd=temp_dir, capture_output=True)
+                # Install dependencies through the shared npm cache so
+                # repeated runs resolve from disk; a node_modules that
+                # survived from a cached worktree is reused as-is
+                if "node_modules" not in entries:
+                    async with self._install_sem:
+                        await self._run_with_retry(
+                            [
+                                "npm",
+                                "install",
+                                "--prefer-offline",
+                                "--no-audit",
+                                "--no-fund",
+                            ],
+                            timeout=300,
+                            cwd=temp_dir,
+                            env={
+                                **os.environ,
+                                "NPM_CONFIG_CACHE": str(REPO_CACHE_ROOT / "npm-cache"),
+                            },
+                        )
 
-                # Try to find start script
-                with open(repo_path / "package.json") as f:
-                    package_json = json.load(f)
+                # Try to find start script; the read is bounded and the
+                # parse guarded so one pathological package.json cannot
+                # take down the whole setup
+                data = (repo_path / "package.json").read_bytes()
+                if len(data) > 1_000_000:
+                    logger.warning(
+                        f"package.json in {temp_dir} exceeds 1 MB; "
+                        "skipping script detection"
+                    )
+                else:
+                    try:
+                        package_json = (
+                            orjson.loads(data)
+                            if orjson is not None
+                            else json.loads(data)
+                        )
+                    except ValueError:
+                        logger.warning(f"Unparseable package.json in {temp_dir}")
+                        package_json = {}
+                    # Cached for any later step that needs the manifest
+                    config["package_json"] = package_json
                     scripts = package_json.get("scripts", {})
                     if "start" in scripts:
                         config["start_command"] = ["npm", "start"]
                     elif "dev" in scripts:
                         config["start_command"] = ["npm", "run", "dev"]
 
-            elif (repo_path / "pyproject.toml").exists() or (
-                repo_path / "setup.py"
-            ).exists():
+            elif "pyproject.toml" in entries or "setup.py" in entries:
                 config["type"] = "python"
                 config["port"] = 8080
 
-                # Install package
-                subprocess.run(
-                    [sys.executable, "-m", "pip", "install", "-e", "."],
-                    cwd=temp_dir,
-                    capture_output=True,
-                )
+                # Install package; the shared wheel cache skips
+                # re-downloading and re-building deps on warm runs
+                async with self._install_sem:
+                    await self._run_with_retry(
+                        [
+                            sys.executable,
+                            "-m",
+                            "pip",
+                            "install",
+                            "--cache-dir",
+                            str(REPO_CACHE_ROOT / "pip-cache"),
+                            "-e",
+                            ".",
+                        ],
+                        timeout=300,
+                        cwd=temp_dir,
+                    )
 
-                # Look for common entry points
-                if (repo_path / "src").exists():
-                    src_dirs = list((repo_path / "src").glob("mcp_*"))
-                    if src_dirs:
-                        module_name = src_dirs[0].name
+                # Look for common entry points; scandir stops at the
+                # first hit instead of materializing a Path per entry
+                if "src" in entries and entries["src"].is_dir():
+                    module_name = next(
+                        (
+                            entry.name
+                            for entry in os.scandir(entries["src"].path)
+                            if entry.is_dir() and entry.name.startswith("mcp_")
+                        ),
+                        None,
+                    )
+                    if module_name:
                         config["start_command"] = [sys.executable, "-m", module_name]
 
                 # Check for examples
-                examples_dir = repo_path / "examples"
-                if examples_dir.exists():
-                    server_files = list(examples_dir.glob("*server*.py"))
-                    if server_files:
-                        config["start_command"] = [sys.executable, str(server_files[0])]
+                if "examples" in entries and entries["examples"].is_dir():
+                    server_file = next(
+                        (
+                            entry.path
+                            for entry in os.scandir(entries["examples"].path)
+                            if entry.is_file()
+                            and "server" in entry.name
+                            and entry.name.endswith(".py")
+                        ),
+                        None,
+                    )
+                    if server_file:
+                        config["start_command"] = [sys.executable, server_file]
 
             return config
 
         except Exception as e:
             logger.error(f"Failed to setup test environment for {server_name}: {e}")
-            if "temp_dir" in locals():
+            if temp_dir:
                 shutil.rmtree(temp_dir, ignore_errors=True)
             return None
 
-    async def start_server(self, config: Dict) -> Optional[subprocess.Popen]:
+    async def _drain_pipe(self, stream, tail: bytearray) -> None:
+        """Keep a server pipe flowing, retaining only the newest output.
+
+        Without a reader, a chatty server fills the ~64 KiB kernel pipe
+        buffer and stalls mid-write, which then looks like a dead server.
+        The tail buffer keeps the last SERVER_OUTPUT_TAIL bytes for
+        diagnostics and discards the rest.
+        """
+        while True:
+            chunk = await stream.read(16384)
+            if not chunk:
+                return
+            tail += chunk
+            if len(tail) > SERVER_OUTPUT_TAIL:
+                del tail[: len(tail) - SERVER_OUTPUT_TAIL]
+
+    async def _wait_until_ready(self, port: int, deadline: float = 10.0) -> bool:
+        """Probe a TCP port with exponential backoff until it accepts.
+
+        Replaces a fixed startup sleep: fast servers are detected within
+        tens of milliseconds, while slow but correct ones get the full
+        deadline before being declared dead.
+        """
+        loop = asyncio.get_running_loop()
+        end = loop.time() + deadline
+        delay = 0.05
+        while loop.time() < end:
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection("127.0.0.1", port), timeout=0.25
+                )
+                writer.close()
+                await writer.wait_closed()
+                return True
+            except (OSError, asyncio.TimeoutError):
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.4)
+        return False
+
+    async def start_server(self, config: Dict) -> Optional[asyncio.subprocess.Process]:
         """Start a server process"""
         if not config.get("start_command"):
             return None
@@ -232,74 +613,143 @@ if __name__ == "__main__":
                 command.extend(["--port", str(config["port"])])
 
             logger.info(f"Starting server with command: {' '.join(command)}")
-            process = subprocess.Popen(
-                command,
+            process = await asyncio.create_subprocess_exec(
+                *command,
                 cwd=config["path"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
 
-            # Wait for server to start
-            await asyncio.sleep(3)
+            # Drain both pipes for the life of the server; the tasks end
+            # on their own at pipe EOF when the process exits. Kept on
+            # the config so they are not garbage-collected mid-run.
+            stderr_tail = bytearray()
+            config["stderr_tail"] = stderr_tail
+            config["drain_tasks"] = [
+                asyncio.create_task(self._drain_pipe(process.stdout, bytearray())),
+                asyncio.create_task(self._drain_pipe(process.stderr, stderr_tail)),
+            ]
+
+            # Wait for the server to accept connections; without a known
+            # port fall back to a short grace period
+            if config.get("port"):
+                ready = await self._wait_until_ready(config["port"])
+            else:
+                await asyncio.sleep(3)
+                ready = True
 
-            # Check if process is still running
-            if process.poll() is None:
+            if ready and process.returncode is None:
                 return process
             else:
-                stdout, stderr = process.communicate()
-                logger.error(f"Server failed to start: {stderr}")
+                if process.returncode is None:
+                    process.terminate()
+                    await process.wait()
+                await asyncio.gather(*config["drain_tasks"])
+                logger.error(
+                    f"Server failed to start: {stderr_tail.decode(errors='replace')}"
+                )
                 return None
 
         except Exception as e:
             logger.error(f"Failed to start server: {e}")
             return None
 
-    async def validate_server(self, server_url: str) -> Dict:
-        """Validate a running server using our validation tools"""
-        try:
-            # Build path to validation binary
-            project_root = Path(__file__).parent.parent
-            validator_path = project_root / "target" / "release" / "mcp-validate"
+    async def ensure_validator_built(self) -> bool:
+        """Build the validation binary once, before any validations run.
 
-            if not validator_path.exists():
-                # Try to build it
+        Building lazily inside validate_server would let every concurrent
+        validation race into its own multi-minute cargo build; the lock
+        plus the done flag make this a one-shot initializer.
+        """
+        async with self._build_lock:
+            if self._build_done:
+                return self.validator_path.exists()
+
+            if not self.validator_path.exists():
                 logger.info("Building validation tools...")
-                build_result = subprocess.run(
+                returncode, stderr = await self._run_with_retry(
                     ["cargo", "build", "--release", "--features", "fuzzing,proptest"],
-                    cwd=project_root,
-                    capture_output=True,
-                    text=True,
+                    timeout=1800,
+                    attempts=2,
+                    cwd=str(self.validator_path.parent.parent.parent),
                 )
-                if build_result.returncode != 0:
-                    return {"status": "build_failed", "error": build_result.stderr}
+                if returncode != 0:
+                    logger.error(f"Failed to build validation tools: {stderr}")
+
+            self._build_done = True
+            return self.validator_path.exists()
+
+    async def validate_server(self, server_url: str) -> Dict:
+        """Validate a running server using our validation tools"""
+        try:
+            if not self.validator_path.exists():
+                return {"status": "error", "error": "validator binary not built"}
 
             # Run validation
-            result = subprocess.run(
-                [
-                    str(validator_path),
-                    server_url,
-                    "--all",
-                    "--timeout",
-                    str(self.timeout_seconds),
-                    "--format",
-                    "json",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=self.timeout_seconds + 10,
+            proc = await asyncio.create_subprocess_exec(
+                str(self.validator_path),
+                server_url,
+                "--all",
+                "--timeout",
+                str(self.timeout_seconds),
+                "--format",
+                "json",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
 
-            if result.stdout:
+            # Drain both pipes incrementally into capped buffers rather
+            # than letting communicate() buffer an arbitrarily large
+            # report in one piece
+            stdout_buf = bytearray()
+            stderr_buf = bytearray()
+            truncated = False
+
+            async def _drain(stream, buf: bytearray) -> None:
+                nonlocal truncated
+                while True:
+                    chunk = await stream.read(65536)
+                    if not chunk:
+                        return
+                    if len(buf) < MAX_OUTPUT_BYTES:
+                        buf += chunk
+                    else:
+                        truncated = True
+
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        _drain(proc.stdout, stdout_buf),
+                        _drain(proc.stderr, stderr_buf),
+                        proc.wait(),
+                    ),
+                    timeout=self.timeout_seconds + 10,
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                return {"status": "timeout"}
+
+            if truncated:
+                return {
+                    "status": "error",
+                    "error": f"validator output exceeded {MAX_OUTPUT_BYTES} bytes",
+                }
+
+            if stdout_buf:
                 try:
-                    return json.loads(result.stdout)
+                    return json.loads(bytes(stdout_buf))
                 except json.JSONDecodeError:
-                    return {"status": "parse_error", "raw_output": result.stdout}
+                    return {
+                        "status": "parse_error",
+                        "raw_output": stdout_buf.decode(errors="replace"),
+                    }
             else:
-                return {"status": "no_output", "stderr": result.stderr}
+                return {
+                    "status": "no_output",
+                    "stderr": stderr_buf.decode(errors="replace"),
+                }
 
-        except subprocess.TimeoutExpired:
-            return {"status": "timeout"}
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
@@ -307,10 +757,14 @@ if __name__ == "__main__":
         self, server_name: str, repo_url: str
     ) -> ValidationResult:
         """Validate a single MCP implementation"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         logger.info(f"Validating {server_name} from {repo_url}")
 
+        # Bound before the try so the cleanup in the finally is safe even
+        # when cancellation lands mid-setup
+        config = None
+
         try:
             # Setup test environment
             config = await self.setup_test_environment(server_name, repo_url)
@@ -323,8 +777,8 @@ if __name__ == "__main__":
                     protocol_version=None,
                     capabilities=[],
                     issues=[],
-                    duration_ms=int((time.time() - start_time) * 1000),
-                    timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                    duration_ms=(time.perf_counter_ns() - start_time) // 1_000_000,
+                    timestamp=_utcnow_iso(),
                     error_message="Failed to setup test environment",
                 )
 
@@ -345,8 +799,8 @@ if __name__ == "__main__":
                         protocol_version=validation_result.get("protocol_version"),
                         capabilities=validation_result.get("capabilities", []),
                         issues=validation_result.get("issues", []),
-                        duration_ms=int((time.time() - start_time) * 1000),
-                        timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                        duration_ms=(time.perf_counter_ns() - start_time) // 1_000_000,
+                        timestamp=_utcnow_iso(),
                     )
                 else:
                     return ValidationResult(
@@ -357,25 +811,35 @@ if __name__ == "__main__":
                         protocol_version=None,
                         capabilities=[],
                         issues=[],
-                        duration_ms=int((time.time() - start_time) * 1000),
-                        timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                        duration_ms=(time.perf_counter_ns() - start_time) // 1_000_000,
+                        timestamp=_utcnow_iso(),
                         error_message="Server process failed to start",
                     )
             finally:
                 # Cleanup server process
-                if process and process.poll() is None:
+                if process and process.returncode is None:
                     process.terminate()
                     try:
-                        await asyncio.wait_for(
-                            asyncio.create_task(asyncio.to_thread(process.wait)),
-                            timeout=5,
-                        )
+                        await asyncio.wait_for(process.wait(), timeout=5)
                     except asyncio.TimeoutError:
                         process.kill()
 
         finally:
-            # Cleanup test environment
+            # Cleanup test environment; unregister the worktree from the
+            # cached repo before removing the directory itself
             if config and config.get("path"):
+                if config.get("cache_dir"):
+                    try:
+                        await self._git(
+                            "--git-dir",
+                            config["cache_dir"],
+                            "worktree",
+                            "remove",
+                            "--force",
+                            config["path"],
+                        )
+                    except Exception:
+                        pass
                 shutil.rmtree(config["path"], ignore_errors=True)
 
         return ValidationResult(
@@ -386,74 +850,140 @@ if __name__ == "__main__":
             protocol_version=None,
             capabilities=[],
             issues=[],
-            duration_ms=int((time.time() - start_time) * 1000),
-            timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            duration_ms=(time.perf_counter_ns() - start_time) // 1_000_000,
+            timestamp=_utcnow_iso(),
             error_message="Unexpected error during validation",
         )
 
+    def open_incremental_report(self, path: str) -> None:
+        """Stream one JSON line per result to path as validations finish."""
+        self._report_fp = open(path, "w")
+
+    def close_incremental_report(self) -> None:
+        """Close the incremental report stream, if one is open."""
+        if self._report_fp is not None:
+            self._report_fp.close()
+            self._report_fp = None
+
+    async def set_max_concurrent(self, n: int) -> None:
+        """Resize the concurrency limit while a run is in flight.
+
+        Raising the limit wakes every waiter so the new slots fill
+        immediately; lowering it simply lets in-flight validations drain
+        below the new ceiling.
+        """
+        async with self._cv:
+            self.max_concurrent = n
+            self._cv.notify_all()
+
     async def run_validation(self) -> List[ValidationResult]:
         """Run validation against all discovered servers"""
         servers = await self.discover_servers()
 
-        # Create semaphore to limit concurrent validations
-        semaphore = asyncio.Semaphore(self.max_concurrent)
-
-        async def validate_with_semaphore(server_name: str, repo_url: str):
-            async with semaphore:
+        # Build the validator up front so concurrent validations never
+        # race into cargo; without the binary there is nothing to run
+        if not await self.ensure_validator_built():
+            logger.error("Validator binary unavailable; aborting run")
+            self.results = []
+            return self.results
+
+        async def validate_with_admission(server_name: str, repo_url: str):
+            async with self._cv:
+                await self._cv.wait_for(lambda: self._active < self.max_concurrent)
+                self._active += 1
+            try:
                 return await self.validate_implementation(server_name, repo_url)
+            finally:
+                async with self._cv:
+                    self._active -= 1
+                    self._cv.notify(1)
 
-        # Run validations concurrently
-        tasks = [
-            validate_with_semaphore(server_name, repo_url)
-            for server_name, repo_url in servers
-        ]
-
-        self.results = await asyncio.gather(*tasks, return_exceptions=True)
+        total = len(servers)
+        self.results = [None] * total
+        completed = 0
 
-        # Filter out exceptions and convert to ValidationResult objects
-        valid_results = []
-        for result in self.results:
-            if isinstance(result, ValidationResult):
-                valid_results.append(result)
-            elif isinstance(result, Exception):
-                logger.error(f"Validation failed with exception: {result}")
+        async def _run_one(index: int, server_name: str, repo_url: str) -> None:
+            nonlocal completed
+            try:
+                result = await validate_with_admission(server_name, repo_url)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Attribute the failure to its server instead of
+                # dropping the result on the floor
+                logger.error(f"Validation of {server_name} raised: {e!r}")
+                result = ValidationResult(
+                    server_name=server_name,
+                    server_url=repo_url,
+                    status="error",
+                    compliance_score=None,
+                    protocol_version=None,
+                    capabilities=[],
+                    issues=[],
+                    duration_ms=0,
+                    timestamp=_utcnow_iso(),
+                    error_message=repr(e),
+                )
+            self.results[index] = result
+            completed += 1
+            logger.info(
+                f"Completed {completed}/{total}: "
+                f"{result.server_name} ({result.status})"
+            )
+            # Each completion is flushed to the incremental report
+            # immediately, so an interrupted run still leaves a usable
+            # partial report
+            if self._report_fp is not None:
+                entry = _result_to_dict(result)
+                if orjson is not None:
+                    self._report_fp.write(orjson.dumps(entry).decode() + "\n")
+                else:
+                    self._report_fp.write(json.dumps(entry) + "\n")
+                self._report_fp.flush()
+
+        # The TaskGroup gives structured cancellation: an interrupt
+        # cancels every in-flight validation, which runs their cleanup
+        # paths (server teardown, temp dirs) before the exception leaves
+        # this scope
+        async with asyncio.TaskGroup() as tg:
+            for index, (server_name, repo_url) in enumerate(servers):
+                tg.create_task(
+                    _run_one(index, server_name, repo_url),
+                    name=f"validate:{server_name}",
+                )
 
-        self.results = valid_results
+        # Results land by index, so the final list keeps discovery order
+        self.results = [r for r in self.results if r is not None]
         return self.results
 
     def generate_report(self, output_file: Optional[str] = None) -> Dict:
         """Generate a comprehensive validation report"""
         total_validations = len(self.results)
-        successful_validations = sum(
-            1 for r in self.results if r.status in ["compliant", "passed"]
-        )
-
-        # Calculate statistics
-        avg_compliance = None
-        if successful_validations > 0:
-            scores = [
-                r.compliance_score
-                for r in self.results
-                if r.compliance_score is not None
-            ]
-            if scores:
-                avg_compliance = sum(scores) / len(scores)
-
-        # Group by status
-        status_counts = {}
-        for result in self.results:
-            status_counts[result.status] = status_counts.get(result.status, 0) + 1
 
-        # Protocol version distribution
-        protocol_versions = {}
+        # One pass over the results folds every aggregate the report and
+        # the recommendations need, instead of a separate comprehension
+        # (and a separate walk of the list) per statistic
+        successful_validations = 0
+        score_sum = 0.0
+        score_count = 0
+        status_counts: Dict[str, int] = defaultdict(int)
+        protocol_versions: Dict[str, int] = defaultdict(int)
         for result in self.results:
+            status_counts[result.status] += 1
+            if result.status in SUCCESS_STATUSES:
+                successful_validations += 1
+            if result.compliance_score is not None:
+                score_sum += result.compliance_score
+                score_count += 1
             if result.protocol_version:
-                protocol_versions[result.protocol_version] = (
-                    protocol_versions.get(result.protocol_version, 0) + 1
-                )
+                protocol_versions[result.protocol_version] += 1
+
+        avg_compliance = None
+        if successful_validations > 0 and score_count > 0:
+            avg_compliance = score_sum / score_count
 
         report = {
-            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "timestamp": _utcnow_iso(),
             "summary": {
                 "total_validations": total_validations,
                 "successful_validations": successful_validations,
@@ -464,26 +994,36 @@ if __name__ == "__main__":
                 ),
                 "average_compliance_score": avg_compliance,
             },
-            "status_distribution": status_counts,
-            "protocol_version_distribution": protocol_versions,
-            "detailed_results": [asdict(result) for result in self.results],
-            "recommendations": self._generate_recommendations(),
+            "status_distribution": dict(status_counts),
+            "protocol_version_distribution": dict(protocol_versions),
+            "detailed_results": [_result_to_dict(result) for result in self.results],
+            "recommendations": self._generate_recommendations(
+                total_validations - successful_validations,
+                status_counts,
+                len(protocol_versions),
+            ),
         }
 
         if output_file:
-            with open(output_file, "w") as f:
-                json.dump(report, f, indent=2)
+            if orjson is not None:
+                with open(output_file, "wb") as f:
+                    f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file, "w") as f:
+                    json.dump(report, f, indent=2)
             logger.info(f"Report saved to {output_file}")
 
         return report
 
-    def _generate_recommendations(self) -> List[str]:
-        """Generate recommendations based on validation results"""
+    def _generate_recommendations(
+        self,
+        failed_count: int,
+        status_counts: Dict[str, int],
+        version_count: int,
+    ) -> List[str]:
+        """Generate recommendations from the aggregates of generate_report"""
         recommendations = []
 
-        failed_count = sum(
-            1 for r in self.results if r.status not in ["compliant", "passed"]
-        )
         if failed_count > 0:
             recommendations.append(
                 f"🔧 {failed_count} implementations failed validation. "
@@ -491,14 +1031,14 @@ if __name__ == "__main__":
             )
 
         # Check for common issues
-        setup_failures = sum(1 for r in self.results if r.status == "setup_failed")
+        setup_failures = status_counts.get("setup_failed", 0)
         if setup_failures > 0:
             recommendations.append(
                 f"⚠️ {setup_failures} implementations had setup issues. "
                 "This may indicate missing dependencies or unclear setup instructions."
             )
 
-        start_failures = sum(1 for r in self.results if r.status == "failed_to_start")
+        start_failures = status_counts.get("failed_to_start", 0)
         if start_failures > 0:
             recommendations.append(
                 f"🚀 {start_failures} servers failed to start. "
@@ -506,8 +1046,7 @@ if __name__ == "__main__":
             )
 
         # Protocol version analysis
-        versions = [r.protocol_version for r in self.results if r.protocol_version]
-        if len(set(versions)) > 1:
+        if version_count > 1:
             recommendations.append(
                 "📋 Multiple protocol versions detected. "
                 "Ensure backward compatibility across versions."
@@ -543,6 +1082,11 @@ async def main():
 
     logger.info("Starting MCP ecosystem validation...")
 
+    if args.output:
+        # Per-result JSONL alongside the summary report; written as each
+        # validation completes so Ctrl-C keeps the finished portion
+        validator.open_incremental_report(args.output + ".jsonl")
+
     try:
         results = await validator.run_validation()
         report = validator.generate_report(args.output)
@@ -572,6 +1116,9 @@ async def main():
     except Exception as e:
         logger.error(f"Validation failed: {e}")
         sys.exit(1)
+    finally:
+        validator.close_incremental_report()
+        await validator.aclose()
 
 
 if __name__ == "__main__":
@@ -468,6 +468,12 @@ impl PythonSdkTester {
         // Main test runner
         self.create_test_script("run_test.py", include_str!("../python_tests/run_test.py"))?;
 
+        // Shared helper modules the test scripts import; the deployed
+        // directory is the whole PYTHONPATH, so these must ship with them
+        self.create_test_script("_client.py", include_str!("../python_tests/_client.py"))?;
+        self.create_test_script("_types.py", include_str!("../python_tests/_types.py"))?;
+        self.create_test_script("_cache.py", include_str!("../python_tests/_cache.py"))?;
+
         // Create missing test scripts with basic implementations
         self.create_missing_test_scripts()?;
 
@@ -1091,6 +1097,90 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_embedded_scripts_run_from_bare_dir() {
+        // The harness deploys only the embedded files into a fresh
+        // directory and runs run_test.py there with that directory as
+        // the whole PYTHONPATH, so the embedded set must be
+        // self-contained: a missing helper module is a hard
+        // ModuleNotFoundError for every compatibility check.
+        let python_path = match PythonSdkTester::find_python() {
+            Ok(path) => path,
+            // Don't fail as Python might not be installed in CI
+            Err(_) => return,
+        };
+
+        let dir = tempfile::tempdir().expect("Failed to create temp dir");
+        let scripts = [
+            ("run_test.py", include_str!("../python_tests/run_test.py")),
+            ("_client.py", include_str!("../python_tests/_client.py")),
+            ("_types.py", include_str!("../python_tests/_types.py")),
+            ("_cache.py", include_str!("../python_tests/_cache.py")),
+            (
+                "test_basic_connection.py",
+                include_str!("../python_tests/test_basic_connection.py"),
+            ),
+            (
+                "test_tool_execution.py",
+                include_str!("../python_tests/test_tool_execution.py"),
+            ),
+            (
+                "test_resource_access.py",
+                include_str!("../python_tests/test_resource_access.py"),
+            ),
+            (
+                "test_transport_compat.py",
+                include_str!("../python_tests/test_transport_compat.py"),
+            ),
+            (
+                "test_error_handling.py",
+                include_str!("../python_tests/test_error_handling.py"),
+            ),
+        ];
+        for (name, content) in scripts {
+            fs::write(dir.path().join(name), content).expect("Failed to write test script");
+        }
+
+        // error_handling reaches a closed port, so the run fails fast
+        // but must still import cleanly and report JSON on stdout
+        let request = serde_json::json!({
+            "server_url": "http://127.0.0.1:9/",
+            "test_type": "error_handling",
+            "config": {
+                "timeout": 2,
+                "transport": "http",
+                "verbose": false,
+                "params": {},
+            },
+        })
+        .to_string();
+
+        let output = Command::new(&python_path)
+            .arg(dir.path().join("run_test.py"))
+            .arg("--json")
+            .stdin(Stdio::piped())
+            .stdout(Stdio::piped())
+            .stderr(Stdio::piped())
+            .env("PYTHONPATH", dir.path())
+            .spawn()
+            .and_then(|mut child| {
+                if let Some(stdin) = child.stdin.as_mut() {
+                    let _ = stdin.write_all(request.as_bytes());
+                }
+                child.wait_with_output()
+            })
+            .expect("Failed to run embedded run_test.py");
+
+        assert!(
+            output.status.success(),
+            "run_test.py failed from a bare script dir: {}",
+            String::from_utf8_lossy(&output.stderr)
+        );
+        let stdout = String::from_utf8_lossy(&output.stdout);
+        serde_json::from_str::<serde_json::Value>(stdout.trim())
+            .expect("run_test.py did not emit JSON on stdout");
+    }
+
     #[test]
     fn test_test_type_names() {
         assert_eq!(